@@ -14,7 +14,7 @@ import numpy
 from matplotlib import cm, gridspec, pyplot
 from matplotlib.ticker import NullFormatter
 from numpy.polynomial import chebyshev, polynomial
-from scipy import interpolate, ndimage, optimize
+from scipy import fft, interpolate, ndimage, optimize, sparse
 
 from ..potential import evaluatelinearForces, evaluatelinearPotentials
 from ..util import galpyWarning
@@ -78,33 +78,16 @@ class actionAngleVerticalInverse(actionAngleInverse):
         self._aAV = actionAngleVertical(pot=self._pot)
         # Compute action, frequency, and xmax for each energy
         self._nE = len(Es)
-        js = numpy.empty(self._nE)
-        Omegas = numpy.empty(self._nE)
-        xmaxs = numpy.empty(self._nE)
         self._Es = numpy.sort(numpy.array(Es))
-        for ii, E in enumerate(Es):
-            if (E - evaluatelinearPotentials(self._pot, 0.0)) < 1e-14:
-                # J=0, should be using vertical freq. from 2nd deriv.
-                tJ, tO = self._aAV.actionsFreqs(
-                    0.0,
-                    numpy.sqrt(
-                        2.0 * (E + 1e-5 - evaluatelinearPotentials(self._pot, 0.0))
-                    ),
-                )
-                js[ii] = 0.0
-                Omegas[ii] = tO[0]
-                xmaxs[ii] = 0.0
-                continue
-            tJ, tO = self._aAV.actionsFreqs(
-                0.0, numpy.sqrt(2.0 * (E - evaluatelinearPotentials(self._pot, 0.0)))
-            )
-            js[ii] = tJ[0]
-            Omegas[ii] = tO[0]
-            xmaxs[ii] = self._aAV.calcxmax(
-                0.0,
-                numpy.sqrt(2.0 * (E - evaluatelinearPotentials(self._pot, 0.0))),
-                E=E,
-            )
+        phi0 = evaluatelinearPotentials(self._pot, 0.0)
+        # J=0 for E = Phi(0), should be using vertical freq. from 2nd deriv.
+        zeroJ = (self._Es - phi0) < 1e-14
+        js, Omegas = self._aAV.actionsFreqs(
+            numpy.zeros(self._nE),
+            numpy.sqrt(2.0 * (self._Es + 1e-5 * zeroJ - phi0)),
+        )
+        js[zeroJ] = 0.0
+        xmaxs = _xmax(self._pot, self._Es, self._aAV, maxiter)
         self._js = js
         self._Omegas = Omegas
         self._xmaxs = xmaxs
@@ -120,10 +103,12 @@ class actionAngleVerticalInverse(actionAngleInverse):
             self._pt_deg = 1
             self._pt_nxa = pt_nxa
             self._pt_xmaxs = self._xmaxs
-            self._pt_coeffs = numpy.zeros((self._nE, 2))
-            self._pt_coeffs[:, 1] = 1.0
-            self._pt_deriv_coeffs = numpy.ones((self._nE, 1))
-            self._pt_deriv2_coeffs = numpy.zeros((self._nE, 1))
+            self._pt_all_coeffs = numpy.zeros((self._nE, 3, 2))
+            self._pt_all_coeffs[:, 0, 1] = 1.0
+            self._pt_all_coeffs[:, 1, 0] = 1.0
+            self._pt_coeffs = self._pt_all_coeffs[:, 0]
+            self._pt_deriv_coeffs = self._pt_all_coeffs[:, 1, :1]
+            self._pt_deriv2_coeffs = self._pt_all_coeffs[:, 2, :1]
         # Now map all tori
         self._nta = nta
         self._thetaa = numpy.linspace(0.0, 2.0 * numpy.pi * (1.0 - 1.0 / nta), nta)
@@ -131,63 +116,50 @@ class actionAngleVerticalInverse(actionAngleInverse):
         self._angle_tol = angle_tol
         self._bisect = bisect
         self._xgrid = self._create_xgrid()
-        self._ja = _ja(
+        # Auxiliary action and its derivative in one evaluation, returned as
+        # views of a single (2,nE,nta) buffer
+        self._ja, self._djadj = _ja_djadj(
             self._xgrid,
             self._Egrid,
             self._pot,
             self._omegagrid,
             self._ptcoeffsgrid,
             self._ptderivcoeffsgrid,
+            self._ptderiv2coeffsgrid,
             self._xmaxgrid,
             self._ptxmaxgrid,
         )
-        self._djadj = (
-            _djadj(
-                self._xgrid,
-                self._Egrid,
-                self._pot,
-                self._omegagrid,
-                self._ptcoeffsgrid,
-                self._ptderivcoeffsgrid,
-                self._ptderiv2coeffsgrid,
-                self._xmaxgrid,
-                self._ptxmaxgrid,
-            )
-            * numpy.atleast_2d(self._Omegas / self._OmegaHO).T
-        )  # In case not 1!
+        self._djadj *= (self._Omegas / self._OmegaHO)[:, None]  # In case not 1!
         self._djadj[self._js < 1e-10] = 1.0  # J = 0 special case
         # Store mean(ja), this is only a better approx. of j w/ no PT!
         self._js_orig = copy.copy(self._js)
         self._js = numpy.nanmean(self._ja, axis=1)
         # Store better approximation to Omega
         self._Omegas_orig = copy.copy(self._Omegas)
-        self._Omegas /= numpy.nanmean(self._djadj, axis=1)
-        # Compute Fourier expansions
+        mean_djadj = numpy.nanmean(self._djadj, axis=1)
+        self._Omegas /= mean_djadj
+        # Compute Fourier expansions, both in a single batched FFT
         self._nforSn = numpy.arange(self._ja.shape[1] // 2 + 1)
-        self._nSn = (
-            numpy.real(
-                numpy.fft.rfft(
-                    self._ja - numpy.atleast_2d(numpy.nanmean(self._ja, axis=1)).T,
-                    axis=1,
-                )
-            )[:, 1:]
-            / self._ja.shape[1]
-        )
-        self._dSndJ = (
-            numpy.real(
-                numpy.fft.rfft(
-                    self._djadj / numpy.atleast_2d(numpy.nanmean(self._djadj, axis=1)).T
-                    - 1.0,
-                    axis=1,
-                )
-            )[:, 1:]
-            / self._ja.shape[1]
+        # (normalized by 1/nta in the FFT itself, a single copy of the real part)
+        fourier_in = numpy.empty((2,) + self._ja.shape)
+        numpy.subtract(self._ja, self._js[:, None], out=fourier_in[0])
+        numpy.divide(self._djadj, mean_djadj[:, None], out=fourier_in[1])
+        fourier_in[1] -= 1.0
+        self._nSn, self._dSndJ = (
+            fft.rfft(
+                fourier_in,
+                axis=-1,
+                norm="forward",
+                workers=-1,
+            )
+            .real[:, :, 1:]
+            .copy()
         )
         # Interpolation of small, noisy coeffs doesn't work, so set to zero
         if setup_interp:
             self._nSn[numpy.fabs(self._nSn) < 1e-16] = 0.0
             self._dSndJ[numpy.fabs(self._dSndJ) < 1e-15] = 0.0
-        self._dSndJ /= numpy.atleast_2d(self._nforSn)[:, 1:]
+        self._dSndJ /= self._nforSn[1:]
         self._nforSn = self._nforSn[1:]
         self._js[self._Es < 1e-10] = 0.0
         # Should use sqrt(2nd deriv. pot), but currently not implemented for 1D
@@ -196,6 +168,24 @@ class actionAngleVerticalInverse(actionAngleInverse):
             self._Omegas[self._Es < 1e-10] = self._Omegas[1]
         self._nSn[self._js < 1e-10] = 0.0
         self._dSndJ[self._js < 1e-10] = 0.0
+        # Store n S_n and n dS_n/dJ (which enters the derivative of the angle
+        # mapping for every torus) together, as they are used together
+        self._fourier = numpy.empty(self._nSn.shape + (2,))
+        self._fourier[:, :, 0] = self._nSn
+        self._fourier[:, :, 1] = self._nforSn * self._dSndJ
+        self._nSn = self._fourier[:, :, 0]
+        self._ndSndJ = self._fourier[:, :, 1]
+        # Look-up tables of the torus index for given E or J: values, sorting
+        # order, and a dict for exact matches (first torus wins for
+        # duplicates, like nanargmin)
+        self._torus_lookup = {
+            key: (
+                vals,
+                numpy.argsort(vals, kind="stable"),
+                {float(val): ii for ii, val in reversed(list(enumerate(vals)))},
+            )
+            for key, vals in [("E", self._Es), ("J", self._js)]
+        }
         # Setup interpolation if requested
         if setup_interp:
             self._interp = True
@@ -204,74 +194,160 @@ class actionAngleVerticalInverse(actionAngleInverse):
             self._interp = False
         return None
 
+    def _find_torus(self, val, key, err_msg):
+        # Index of the torus with E or J (key) equal to val, direct look-up
+        # for exact matches and otherwise search for the nearest torus; for
+        # multiple values, search all at once in the sorted values
+        vals, sortindx, indx_lookup = self._torus_lookup[key]
+        if numpy.size(val) > 1:
+            pos = numpy.searchsorted(vals[sortindx], val)
+            lo = sortindx[numpy.clip(pos - 1, 0, len(vals) - 1)]
+            hi = sortindx[numpy.clip(pos, 0, len(vals) - 1)]
+            indx = numpy.where(
+                numpy.fabs(val - vals[hi]) < numpy.fabs(val - vals[lo]), hi, lo
+            )
+            if not numpy.all(numpy.fabs(val - vals[indx]) <= 1e-10):
+                raise ValueError(err_msg)
+            return indx
+        indx = indx_lookup.get(float(val)) if numpy.ndim(val) == 0 else None
+        if indx is None:
+            indx = numpy.nanargmin(numpy.fabs(val - vals))
+            if numpy.fabs(val - vals[indx]) > 1e-10:
+                raise ValueError(err_msg)
+        return indx
+
     def _setup_pointtransform(self, pt_deg, pt_nxa):
         # Setup a point transformation for each torus
         self._pt_deg = pt_deg
         self._pt_nxa = pt_nxa
         xamesh = numpy.linspace(-1.0, 1.0, pt_nxa)
-        self._pt_coeffs = numpy.empty((self._nE, pt_deg + 1))
-        self._pt_deriv_coeffs = numpy.empty((self._nE, pt_deg))
-        self._pt_deriv2_coeffs = numpy.empty((self._nE, pt_deg - 1))
+        # The transformation and its derivatives are always used together,
+        # so store them in one array, zero-padding the derivatives, and
+        # expose views of the separate coefficients
+        self._pt_all_coeffs = numpy.zeros((self._nE, 3, pt_deg + 1))
+        self._pt_coeffs = self._pt_all_coeffs[:, 0]
+        self._pt_deriv_coeffs = self._pt_all_coeffs[:, 1, :pt_deg]
+        self._pt_deriv2_coeffs = self._pt_all_coeffs[:, 2, : pt_deg - 1]
         self._pt_xmaxs = numpy.sqrt(2.0 * self._js / self._OmegaHO)
-        for ii in range(self._nE):
-            if self._js[ii] < 1e-10:  # Just use identity for small J
-                self._pt_coeffs[ii] = 0.0
-                self._pt_coeffs[ii, 1] = 1.0
-                self._pt_deriv_coeffs[ii] = 1.0
-                self._pt_deriv2_coeffs[ii] = 0.0
-                self._pt_xmaxs[ii] = self._xmaxs[ii] + 1e-10  # avoid /0
-                coeffs = self._pt_coeffs[ii]  # to start next fit
-                continue
-            Ea = self._js[ii] * self._OmegaHO[ii]
-
-            # Function to optimize with least squares: p-p
-            def opt_func(coeffs):
+        # Chebyshev polynomials and their derivatives on the mesh, such that
+        # evaluating the transformation in opt_func is a matrix product
+        chebmesh = chebyshev.chebvander(xamesh, pt_deg)
+        dchebmesh = chebyshev.chebval(
+            xamesh, chebyshev.chebder(numpy.eye(pt_deg + 1))
+        ).T
+        # Just use identity for small J
+        smallJ = self._js < 1e-10
+        self._pt_xmaxs[smallJ] = self._xmaxs[smallJ] + 1e-10  # avoid /0
+        fitIndx = numpy.arange(self._nE)[True ^ smallJ]
+        nfit = len(fitIndx)
+        ncoeffs = (pt_deg + 1) // 2 - 1
+        ccoeffs = numpy.zeros((nfit, pt_deg + 1))
+        if nfit > 0:
+            Ea = self._js[fitIndx] * self._OmegaHO[fitIndx]
+            # v from va = 2(E-HO) doesn't depend on the point transformation,
+            # so compute it once per torus rather than in every opt_func call
+            va2mesh = 2.0 * (
+                Ea[:, None]
+                - self._OmegaHO[fitIndx, None] ** 2.0
+                * (xamesh * self._pt_xmaxs[fitIndx, None]) ** 2.0
+                / 2.0
+            )
+            va2mesh[va2mesh < 0.0] = 0.0
+            vamesh = numpy.sqrt(va2mesh)
+            tE = self._Es[fitIndx, None]
+            txmax = self._xmaxs[fitIndx, None]
+            piprime_fac = txmax / self._pt_xmaxs[fitIndx, None]
+            # Residuals of different tori are weighted equally
+            resid_norm = 1.0 / numpy.sqrt(2.0 * Ea[:, None])
+            # The potential is evaluated at different x in each opt_func call,
+            # so tabulate the (symmetric) potential and force over [0,xmax]
+            npot = 2 * pt_nxa
+            xdense = numpy.linspace(0.0, 1.0, npot) * txmax
+            pot_table = evaluatelinearPotentials(self._pot, xdense)
+            dpot_table = -evaluatelinearForces(self._pot, xdense) * (txmax / (npot - 1))
+            rows = numpy.arange(nfit)[:, None]
+            # Indices of the non-zero, block-diagonal, elements of the Jacobian
+            jac_rows, jac_cols = numpy.broadcast_arrays(
+                numpy.arange(nfit * pt_nxa).reshape(nfit, pt_nxa, 1),
+                numpy.arange(nfit * ncoeffs).reshape(nfit, 1, ncoeffs),
+            )
+            jac_rows, jac_cols = jac_rows.flatten(), jac_cols.flatten()
+
+            # Function to optimize with least squares for all tori at once:
+            # p-p for each torus, and its analytic Jacobian if jac=True
+            def opt_func(coeffs, jac=False):
                 # constraints: symmetric, maps [-1,1] --> [-1,1]
-                ccoeffs = numpy.zeros(pt_deg + 1)
-                ccoeffs[1] = 1.0
-                ccoeffs[3::2] = coeffs
-                ccoeffs /= chebyshev.chebval(1, ccoeffs)
-                pt = chebyshev.Chebyshev(ccoeffs)
-                xmesh = pt(xamesh) * self._xmaxs[ii]
-                # Compute v from (E,xmesh)
-                v2mesh = 2.0 * (
-                    self._Es[ii] - evaluatelinearPotentials(self._pot, xmesh)
+                coeffs = numpy.reshape(coeffs, (nfit, ncoeffs))
+                ccoeffs[:, 1] = 1.0
+                ccoeffs[:, 3::2] = coeffs
+                norm = 1.0 + numpy.sum(coeffs, axis=1)[:, None, None]
+                ccoeffs[:] /= norm[:, 0]  # T_n(1) = 1
+                xmesh = numpy.dot(ccoeffs, chebmesh.T) * txmax
+                # Compute v from (E,xmesh), using cubic Hermite interpolation
+                # of the tabulated potential
+                u = numpy.fabs(xmesh) / txmax * (npot - 1)
+                indx = numpy.clip(u.astype("int"), 0, npot - 2)
+                t = u - indx
+                pot_lo, pot_hi = pot_table[rows, indx], pot_table[rows, indx + 1]
+                dpot_lo, dpot_hi = dpot_table[rows, indx], dpot_table[rows, indx + 1]
+                potmesh = (
+                    (1.0 + 2.0 * t) * (1.0 - t) ** 2.0 * pot_lo
+                    + t * (1.0 - t) ** 2.0 * dpot_lo
+                    + t**2.0 * (3.0 - 2.0 * t) * pot_hi
+                    + t**2.0 * (t - 1.0) * dpot_hi
                 )
+                v2mesh = 2.0 * (tE - potmesh)
                 v2mesh[v2mesh < 0.0] = 0.0
                 vmesh = numpy.sqrt(v2mesh)
-                # Compute v from va = 2(E-HO) and transform
-                va2mesh = 2.0 * (
-                    Ea
-                    - self._OmegaHO[ii] ** 2.0
-                    * (xamesh * self._pt_xmaxs[ii]) ** 2.0
-                    / 2.0
+                piprime = numpy.dot(ccoeffs, dchebmesh.T) * piprime_fac
+                if not jac:
+                    vtildemesh = (vamesh - vmesh * (1.0 / piprime - piprime)) / piprime
+                    return ((vmesh - vtildemesh) * resid_norm).flatten()
+                # v-vtilde = v/piprime^2-va/piprime, so its derivative is
+                # dv/piprime^2+(va-2v/piprime)/piprime^2 dpiprime
+                dxdc = (
+                    txmax[:, :, None] * chebmesh[:, 3::2] - xmesh[:, :, None]
+                ) / norm
+                dpiprimedc = (
+                    piprime_fac[:, :, None] * dchebmesh[:, 3::2] - piprime[:, :, None]
+                ) / norm
+                dpotdx = (
+                    6.0 * t * (t - 1.0) * (pot_lo - pot_hi)
+                    + (3.0 * t - 1.0) * (t - 1.0) * dpot_lo
+                    + t * (3.0 * t - 2.0) * dpot_hi
+                ) * (numpy.sign(xmesh) * (npot - 1) / txmax)
+                dvdx = numpy.zeros_like(vmesh)
+                dvdx[vmesh > 0.0] = -dpotdx[vmesh > 0.0] / vmesh[vmesh > 0.0]
+                out = (
+                    dvdx[:, :, None] * dxdc
+                    + ((vamesh - 2.0 * vmesh / piprime)[:, :, None] * dpiprimedc)
+                ) * (resid_norm / piprime**2.0)[:, :, None]
+                return sparse.csr_matrix(
+                    (out.flatten(), (jac_rows, jac_cols)),
+                    shape=(nfit * pt_nxa, nfit * ncoeffs),
                 )
-                va2mesh[va2mesh < 0.0] = 0.0
-                vamesh = numpy.sqrt(va2mesh)
-                piprime = pt.deriv()(xamesh) * self._xmaxs[ii] / self._pt_xmaxs[ii]
-                vtildemesh = (
-                    vamesh - numpy.sqrt(v2mesh) * (1.0 / piprime - piprime)
-                ) / piprime
-                return vmesh - vtildemesh
-
-            if ii == 0:
-                # Start from identity mapping
-                start_coeffs = [0.0]
-                start_coeffs.extend([0.0 for jj in range((pt_deg + 1) // 2 - 2)])
-            else:
-                # Start from previous best fit
-                start_coeffs = coeffs[3::2] / coeffs[1]
-            coeffs = optimize.leastsq(opt_func, start_coeffs)[0]
+
+            # Each torus' residuals only depend on its own coefficients
+            coeffs = optimize.least_squares(
+                opt_func,
+                numpy.zeros(nfit * ncoeffs),  # Start from identity mapping
+                jac=lambda coeffs: opt_func(coeffs, jac=True),
+                xtol=1e-12,
+            ).x
             # Extract full Chebyshev parameters from constrained optimization
-            ccoeffs = numpy.zeros(pt_deg + 1)
-            ccoeffs[1] = 1.0
-            ccoeffs[3::2] = coeffs
-            ccoeffs /= chebyshev.chebval(1, ccoeffs)  # map exact [-1,1] --> [-1,1]
-            coeffs = ccoeffs
-            # Store point transformation as simple polynomial
-            self._pt_coeffs[ii] = chebyshev.cheb2poly(coeffs)
-            self._pt_deriv_coeffs[ii] = polynomial.polyder(self._pt_coeffs[ii], m=1)
-            self._pt_deriv2_coeffs[ii] = polynomial.polyder(self._pt_coeffs[ii], m=2)
+            ccoeffs[:, 1] = 1.0
+            ccoeffs[:, 3::2] = numpy.reshape(coeffs, (nfit, ncoeffs))
+            # map exact [-1,1] --> [-1,1]
+            ccoeffs /= numpy.sum(ccoeffs, axis=1)[:, None]
+        # Store point transformation as simple polynomial
+        self._pt_coeffs[smallJ] = 0.0
+        self._pt_coeffs[smallJ, 1] = 1.0
+        cheb2poly = numpy.zeros((pt_deg + 1, pt_deg + 1))
+        for ii in range(pt_deg + 1):
+            cheb2poly[ii, : ii + 1] = chebyshev.cheb2poly(numpy.eye(ii + 1)[ii])
+        self._pt_coeffs[fitIndx] = numpy.dot(ccoeffs, cheb2poly)
+        self._pt_deriv_coeffs[:] = polynomial.polyder(self._pt_coeffs, m=1, axis=1)
+        self._pt_deriv2_coeffs[:] = polynomial.polyder(self._pt_coeffs, m=2, axis=1)
         return None
 
     def _create_xgrid(self):
@@ -280,97 +356,110 @@ class actionAngleVerticalInverse(actionAngleInverse):
         # To efficiently start the search, we first compute thetaa for a dense
         # grid in x (at +v)
         xgrid = numpy.linspace(-1.0, 1.0, 2 * self._nta)
-        xs = xgrid * numpy.atleast_2d(self._pt_xmaxs).T
+        xs = xgrid * self._pt_xmaxs[:, None]
+        # Per-torus quantities are constant along the grid: use (read-only)
+        # broadcast views rather than tiled copies
         xta = _anglea(
             xs,
-            numpy.tile(self._Es, (xs.shape[1], 1)).T,
+            numpy.broadcast_to(self._Es[:, None], xs.shape),
             self._pot,
-            numpy.tile(self._hoaa._omega, (xs.shape[1], 1)).T,
-            numpy.rollaxis(numpy.tile(self._pt_coeffs, (xs.shape[1], 1, 1)), 1),
-            numpy.rollaxis(numpy.tile(self._pt_deriv_coeffs, (xs.shape[1], 1, 1)), 1),
-            numpy.tile(self._xmaxs, (xs.shape[1], 1)).T,
-            numpy.tile(self._pt_xmaxs, (xs.shape[1], 1)).T,
+            numpy.broadcast_to(self._hoaa._omega[:, None], xs.shape),
+            numpy.broadcast_to(
+                self._pt_coeffs[:, None], xs.shape + self._pt_coeffs.shape[1:]
+            ),
+            numpy.broadcast_to(
+                self._pt_deriv_coeffs[:, None],
+                xs.shape + self._pt_deriv_coeffs.shape[1:],
+            ),
+            numpy.broadcast_to(self._xmaxs[:, None], xs.shape),
+            numpy.broadcast_to(self._pt_xmaxs[:, None], xs.shape),
         )
         xta[numpy.isnan(xta)] = 0.0  # Zero energy orbit -> NaN
         # Now use Newton-Raphson to iterate to a regular grid
         cindx = numpy.nanargmin(
-            numpy.fabs(
-                (xta - numpy.rollaxis(numpy.atleast_3d(self._thetaa), 1) + numpy.pi)
-                % (2.0 * numpy.pi)
-                - numpy.pi
-            ),
+            numpy.fabs(_wrap_angle_diff(xta, self._thetaa[:, None, None])),
             axis=2,
         )
-        xgrid = xgrid[cindx].T * numpy.atleast_2d(self._pt_xmaxs).T
-        Egrid = numpy.tile(self._Es, (self._nta, 1)).T
-        omegagrid = numpy.tile(self._hoaa._omega, (self._nta, 1)).T
-        xmaxgrid = numpy.tile(self._xmaxs, (self._nta, 1)).T
-        ptxmaxgrid = numpy.tile(self._pt_xmaxs, (self._nta, 1)).T
-        ptcoeffsgrid = numpy.rollaxis(numpy.tile(self._pt_coeffs, (self._nta, 1, 1)), 1)
-        ptderivcoeffsgrid = numpy.rollaxis(
-            numpy.tile(self._pt_deriv_coeffs, (self._nta, 1, 1)), 1
-        )
-        ptderiv2coeffsgrid = numpy.rollaxis(
-            numpy.tile(self._pt_deriv2_coeffs, (self._nta, 1, 1)), 1
+        xgrid = xgrid[cindx].T * self._pt_xmaxs[:, None]
+        Egrid = numpy.broadcast_to(self._Es[:, None], xgrid.shape)
+        omegagrid = numpy.broadcast_to(self._hoaa._omega[:, None], xgrid.shape)
+        xmaxgrid = numpy.broadcast_to(self._xmaxs[:, None], xgrid.shape)
+        ptxmaxgrid = numpy.broadcast_to(self._pt_xmaxs[:, None], xgrid.shape)
+        ptallcoeffsgrid = numpy.broadcast_to(
+            self._pt_all_coeffs[:, None],
+            xgrid.shape + self._pt_all_coeffs.shape[1:],
         )
-        ta = _anglea(
-            xgrid,
-            Egrid,
+        ptcoeffsgrid = ptallcoeffsgrid[..., 0, :]
+        ptderivcoeffsgrid = ptallcoeffsgrid[..., 1, : self._pt_deriv_coeffs.shape[1]]
+        ptderiv2coeffsgrid = ptallcoeffsgrid[..., 2, : self._pt_deriv2_coeffs.shape[1]]
+        # The -v part (nta//4 < thetaa index < 3nta//4) is filled in by symmetry
+        # below, so only compute the angles for the +v part
+        ta = numpy.empty(xgrid.shape)
+        pv = numpy.r_[: self._nta // 4 + 1, 3 * self._nta // 4 : self._nta]
+        ta[:, pv] = _anglea(
+            xgrid[:, pv],
+            Egrid[:, pv],
             self._pot,
-            omegagrid,
-            ptcoeffsgrid,
-            ptderivcoeffsgrid,
-            xmaxgrid,
-            ptxmaxgrid,
+            omegagrid[:, pv],
+            ptcoeffsgrid[:, pv],
+            ptderivcoeffsgrid[:, pv],
+            xmaxgrid[:, pv],
+            ptxmaxgrid[:, pv],
         )
-        mta = numpy.tile(self._thetaa, (len(self._Es), 1))
+        mta = numpy.broadcast_to(self._thetaa, xgrid.shape)
         # Now iterate
         cntr = 0
         unconv = numpy.ones(xgrid.shape, dtype="bool")
         # We'll fill in the -v part using the +v, also remove the endpoints
         unconv[:, self._nta // 4 : 3 * self._nta // 4 + 1] = False
         # Also don't bother with J=0 torus
-        unconv[numpy.tile(self._js, (self._nta, 1)).T < 1e-10] = False
-        dta = (ta[unconv] - mta[unconv] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+        unconv[self._js < 1e-10] = False
+        dta = _wrap_angle_diff(ta[unconv], mta[unconv])
         unconv[unconv] = numpy.fabs(dta) > self._angle_tol
         # Don't allow too big steps
-        maxdx = numpy.tile(self._pt_xmaxs / float(self._nta), (self._nta, 1)).T
-        while not self._bisect:
+        maxdx = self._pt_xmaxs / float(self._nta)
+        if not self._bisect:
+            tindx = numpy.nonzero(unconv)[0]
             dtadx = _danglea(
                 xgrid[unconv],
-                Egrid[unconv],
+                self._Es[tindx],
                 self._pot,
-                omegagrid[unconv],
-                ptcoeffsgrid[unconv],
-                ptderivcoeffsgrid[unconv],
-                ptderiv2coeffsgrid[unconv],
-                xmaxgrid[unconv],
-                ptxmaxgrid[unconv],
+                self._hoaa._omega[tindx],
+                self._pt_coeffs[tindx],
+                self._pt_deriv_coeffs[tindx],
+                self._pt_deriv2_coeffs[tindx],
+                self._xmaxs[tindx],
+                self._pt_xmaxs[tindx],
             )
-            dta = (ta[unconv] - mta[unconv] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+        while not self._bisect:
+            # Gather the torus parameters of the unconverged points by torus
+            # index, rather than masking the full (nE,nta,...) grids
+            tindx = numpy.nonzero(unconv)[0]
+            dta = _wrap_angle_diff(ta[unconv], mta[unconv])
             dx = -dta / dtadx
-            dx[numpy.fabs(dx) > maxdx[unconv]] = (numpy.sign(dx) * maxdx[unconv])[
-                numpy.fabs(dx) > maxdx[unconv]
-            ]
+            tmaxdx = maxdx[tindx]
+            numpy.clip(dx, -tmaxdx, tmaxdx, out=dx)
             xgrid[unconv] += dx
-            xgrid[unconv * (xgrid > ptxmaxgrid)] = ptxmaxgrid[
-                unconv * (xgrid > ptxmaxgrid)
-            ]
-            xgrid[unconv * (xgrid < -ptxmaxgrid)] = ptxmaxgrid[
-                unconv * (xgrid < -ptxmaxgrid)
-            ]
-            newta = _anglea(
+            outside = unconv * (xgrid > ptxmaxgrid)
+            xgrid[outside] = ptxmaxgrid[outside]
+            outside = unconv * (xgrid < -ptxmaxgrid)
+            xgrid[outside] = ptxmaxgrid[outside]
+            # Angle and its derivative for the next step in one evaluation
+            newta, dtadx = _anglea_danglea(
                 xgrid[unconv],
-                Egrid[unconv],
+                self._Es[tindx],
                 self._pot,
-                omegagrid[unconv],
-                ptcoeffsgrid[unconv],
-                ptderivcoeffsgrid[unconv],
-                xmaxgrid[unconv],
-                ptxmaxgrid[unconv],
+                self._hoaa._omega[tindx],
+                self._pt_coeffs[tindx],
+                self._pt_deriv_coeffs[tindx],
+                self._pt_deriv2_coeffs[tindx],
+                self._xmaxs[tindx],
+                self._pt_xmaxs[tindx],
             )
             ta[unconv] = newta
-            unconv[unconv] = numpy.fabs(dta) > self._angle_tol
+            stillunconv = numpy.fabs(dta) > self._angle_tol
+            dtadx = dtadx[stillunconv]
+            unconv[unconv] = stillunconv
             cntr += 1
             if numpy.sum(unconv) == 0:
                 break
@@ -387,36 +476,37 @@ class actionAngleVerticalInverse(actionAngleInverse):
             cntr = 0
             # Start from nearest guess from below
             new_xgrid = numpy.linspace(-1.0, 1.0, 2 * self._nta)
-            da = (
-                xta - numpy.rollaxis(numpy.atleast_3d(self._thetaa), 1) + numpy.pi
-            ) % (2.0 * numpy.pi) - numpy.pi
+            da = _wrap_angle_diff(xta, self._thetaa[:, None, None])
             da[da >= 0.0] = -numpy.nanmax(numpy.fabs(da)) - 0.1
             cindx = numpy.nanargmax(da, axis=2)
-            tryx_min = (new_xgrid[cindx].T * numpy.atleast_2d(self._pt_xmaxs).T)[unconv]
+            # Lower end of the bracket for every grid point, updated in place
+            tryx_min = new_xgrid[cindx].T * self._pt_xmaxs[:, None]
             dx = (
-                2.0 / (2.0 * self._nta - 1) * ptxmaxgrid
+                2.0 / (2.0 * self._nta - 1) * self._pt_xmaxs
             )  # delta of initial x grid above
             while True:
                 dx *= 0.5
-                xgrid[unconv] = tryx_min + dx[unconv]
+                tindx = numpy.nonzero(unconv)[0]
+                xgrid[unconv] = tryx_min[unconv] + dx[tindx]
                 newta = (
                     _anglea(
                         xgrid[unconv],
-                        Egrid[unconv],
+                        self._Es[tindx],
                         self._pot,
-                        omegagrid[unconv],
-                        ptcoeffsgrid[unconv],
-                        ptderivcoeffsgrid[unconv],
-                        xmaxgrid[unconv],
-                        ptxmaxgrid[unconv],
+                        self._hoaa._omega[tindx],
+                        self._pt_coeffs[tindx],
+                        self._pt_deriv_coeffs[tindx],
+                        self._xmaxs[tindx],
+                        self._pt_xmaxs[tindx],
                     )
                     + 2.0 * numpy.pi
                 ) % (2.0 * numpy.pi)
                 ta[unconv] = newta
-                dta = (newta - mta[unconv] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
-                tryx_min[newta < mta[unconv]] = xgrid[unconv][newta < mta[unconv]]
+                dta = _wrap_angle_diff(newta, mta[unconv])
+                tryx_min[unconv] = numpy.where(
+                    newta < mta[unconv], xgrid[unconv], tryx_min[unconv]
+                )
                 unconv[unconv] = numpy.fabs(dta) > self._angle_tol
-                tryx_min = tryx_min[numpy.fabs(dta) > self._angle_tol]
                 cntr += 1
                 if numpy.sum(unconv) == 0:
                     break
@@ -447,7 +537,7 @@ class actionAngleVerticalInverse(actionAngleInverse):
             ptxmaxgrid[:, self._nta // 4 + 1 : 3 * self._nta // 4],
             vsign=-1.0,
         )
-        self._dta = (ta - mta + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+        self._dta = _wrap_angle_diff(ta, mta, out=ta)
         self._mta = mta
         # Store these, they are useful (obv. arbitrary to return xgrid
         # and not just store it...)
@@ -466,11 +556,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
         if shift_action is None:
             shift_action = self._pt_deg > 1
         # First find the torus for this energy
-        indx = numpy.nanargmin(numpy.fabs(E - self._Es))
-        if numpy.fabs(E - self._Es[indx]) > 1e-10:
-            raise ValueError(
-                "Given energy not found; please specify an energy used in the initialization of the instance"
-            )
+        indx = self._find_torus(
+            E,
+            "E",
+            "Given energy not found; please specify an energy used in the initialization of the instance",
+        )
         if not overplot:
             gs = gridspec.GridSpec(2, 3, height_ratios=[4, 1])
         else:
@@ -493,34 +583,22 @@ class actionAngleVerticalInverse(actionAngleInverse):
             negv = (self._thetaa > numpy.pi / 2.0) * (
                 self._thetaa < 3.0 * numpy.pi / 2.0
             )
-            thetaa_out = numpy.empty_like(self._thetaa)
-            one = numpy.ones(numpy.sum(True ^ negv))
-            thetaa_out[True ^ negv] = _anglea(
-                self._xgrid[indx][True ^ negv],
+            one = numpy.ones(self._nta)
+            # Both velocity signs in one call using an array of signs
+            thetaa_out = _anglea(
+                self._xgrid[indx],
                 E,
                 self._pot,
                 self._OmegaHO[indx],
                 self._pt_coeffs[indx],
-                numpy.tile(self._pt_deriv_coeffs[indx], (numpy.sum(True ^ negv), 1)),
+                numpy.tile(self._pt_deriv_coeffs[indx], (self._nta, 1)),
                 self._xmaxs[indx] * one,
                 self._pt_xmaxs[indx] * one,
-                vsign=1.0,
-            )
-            one = numpy.ones(numpy.sum(negv))
-            thetaa_out[negv] = _anglea(
-                self._xgrid[indx][negv],
-                E,
-                self._pot,
-                self._OmegaHO[indx],
-                self._pt_coeffs[indx],
-                numpy.tile(self._pt_deriv_coeffs[indx], (numpy.sum(negv), 1)),
-                self._xmaxs[indx] * one,
-                self._pt_xmaxs[indx] * one,
-                vsign=-1.0,
+                vsign=numpy.where(negv, -1.0, 1.0),
             )
             plot.plot(
                 self._thetaa,
-                ((thetaa_out - self._thetaa + numpy.pi) % (2.0 * numpy.pi)) - numpy.pi,
+                _wrap_angle_diff(thetaa_out, self._thetaa, out=thetaa_out),
                 color="k",
                 gcf=True,
                 xlabel=r"$\theta^A$",
@@ -544,19 +622,17 @@ class actionAngleVerticalInverse(actionAngleInverse):
         )
         if not overplot:
             pyplot.gca().xaxis.set_major_formatter(NullFormatter())
+        # Fourier series on the thetaa grid are matrix products with the
+        # (thetaa,n) cosine matrix, which is the same for all tori: cache it
+        if not hasattr(self, "_costhetaa"):
+            self._costhetaa = numpy.cos(numpy.outer(self._thetaa, self._nforSn))
         if not overplot:
+            # Both series from a single product
+            fourier_series = 2.0 * numpy.dot(self._costhetaa, self._fourier[indx])
             pyplot.subplot(gs[4])
             plot.plot(
                 self._thetaa,
-                numpy.array(
-                    [
-                        self._js[indx]
-                        + 2.0 * numpy.sum(self._nSn[indx] * numpy.cos(self._nforSn * x))
-                        for x in self._thetaa
-                    ]
-                )
-                / self._ja[indx]
-                - 1.0,
+                (self._js[indx] + fourier_series[:, 0]) / self._ja[indx] - 1.0,
                 color="k",
                 xlabel=r"$\theta^A$",
                 ylabel=r"$\delta J^A/J^A$",
@@ -580,18 +656,8 @@ class actionAngleVerticalInverse(actionAngleInverse):
             pyplot.subplot(gs[5])
             plot.plot(
                 self._thetaa,
-                numpy.array(
-                    [
-                        1.0
-                        + 2.0
-                        * numpy.sum(
-                            self._nforSn
-                            * self._dSndJ[indx]
-                            * numpy.cos(self._nforSn * x)
-                        )
-                        for x in self._thetaa
-                    ]
-                )
+                1.0
+                + fourier_series[:, 1]
                 - self._djadj[indx] / numpy.nanmean(self._djadj[indx]),
                 color="k",
                 xlabel=r"$\theta^A$",
@@ -622,77 +688,59 @@ class actionAngleVerticalInverse(actionAngleInverse):
                 raise RuntimeError(
                     f"plot_power with >= {minn_for_cmap} energies and overplot=True is not supported"
                 )
+        panels = [
+            (self._nSn, r"$|nS_n|$"),
+            (self._dSndJ, r"$|\mathrm{d}S_n/\mathrm{d}J|$"),
+        ]
+        if len(Es) > 1:
+            # Same range over all tori for all energies; limits only set the
+            # plot range: use float32
+            yranges = []
+            for coeffs, _ in panels:
+                y4minmax = numpy.fabs(coeffs[:, symm :: symm + 1], dtype="float32")
+                y4minmax = y4minmax[numpy.isfinite(y4minmax)]
+                yranges.append(
+                    [numpy.amax([numpy.amin(y4minmax), 1e-17]), numpy.amax(y4minmax)]
+                )
         for ii, E in enumerate(Es):
             # First find the torus for this energy
-            indx = numpy.nanargmin(numpy.fabs(E - self._Es))
-            if numpy.fabs(E - self._Es[indx]) > 1e-10:
-                raise ValueError(
-                    "Given energy not found; please specify an energy used in the initialization of the instance"
-                )
-            # n S_n
-            y = numpy.fabs(self._nSn[indx, symm :: symm + 1])
-            if len(Es) > 1 and E == Es[0]:
-                y4minmax = numpy.fabs(self._nSn[:, symm :: symm + 1])
-                ymin = numpy.amax(
-                    [numpy.amin(y4minmax[numpy.isfinite(y4minmax)]), 1e-17]
-                )
-                ymax = numpy.amax(y4minmax[numpy.isfinite(y4minmax)])
-            elif len(Es) == 1:
-                ymin = numpy.amax([numpy.amin(y[numpy.isfinite(y)]), 1e-17])
-                ymax = numpy.amax(y[numpy.isfinite(y)])
-            if len(Es) < minn_for_cmap:
-                label = rf"$E = {E:g}$"
-                color = f"C{ii}"
-            else:
-                label = None
-                color = cm.plasma((E - Es[0]) / (Es[-1] - Es[0]))
-            pyplot.subplot(gs[0])
-            plot.plot(
-                numpy.fabs(self._nforSn[symm :: symm + 1]),
-                y,
-                yrange=[ymin, ymax],
-                ls=ls,
-                gcf=True,
-                semilogy=True,
-                overplot=overplot,
-                xrange=[0.0, self._nforSn[-1]],
-                label=label,
-                color=color,
-                xlabel=r"$n$",
-                ylabel=r"$|nS_n|$",
+            indx = self._find_torus(
+                E,
+                "E",
+                "Given energy not found; please specify an energy used in the initialization of the instance",
             )
-            # d S_n / d J
-            y = numpy.fabs(self._dSndJ[indx, symm :: symm + 1])
-            if len(Es) > 1 and E == Es[0]:
-                y4minmax = numpy.fabs(self._dSndJ[:, symm :: symm + 1])
-                ymin = numpy.amax(
-                    [numpy.amin(y4minmax[numpy.isfinite(y4minmax)]), 1e-17]
-                )
-                ymax = numpy.amax(y4minmax[numpy.isfinite(y4minmax)])
-            elif len(Es) == 1:
-                ymin = numpy.amax([numpy.amin(y[numpy.isfinite(y)]), 1e-17])
-                ymax = numpy.amax(y[numpy.isfinite(y)])
             if len(Es) < minn_for_cmap:
                 label = rf"$E = {E:g}$"
                 color = f"C{ii}"
             else:
                 label = None
                 color = cm.plasma((E - Es[0]) / (Es[-1] - Es[0]))
-            pyplot.subplot(gs[1])
-            plot.plot(
-                numpy.fabs(self._nforSn[symm :: symm + 1]),
-                y,
-                yrange=[ymin, ymax],
-                ls=ls,
-                gcf=True,
-                semilogy=True,
-                overplot=overplot,
-                xrange=[0.0, self._nforSn[-1]],
-                label=label,
-                color=color,
-                xlabel=r"$n$",
-                ylabel=r"$|\mathrm{d}S_n/\mathrm{d}J|$",
-            )
+            # n S_n and d S_n / d J
+            for jj, (coeffs, ylabel) in enumerate(panels):
+                y = numpy.fabs(coeffs[indx, symm :: symm + 1])
+                if len(Es) == 1:
+                    y4minmax = y[numpy.isfinite(y)]
+                    yrange = [
+                        numpy.amax([numpy.amin(y4minmax), 1e-17]),
+                        numpy.amax(y4minmax),
+                    ]
+                else:
+                    yrange = yranges[jj]
+                pyplot.subplot(gs[jj])
+                plot.plot(
+                    numpy.fabs(self._nforSn[symm :: symm + 1]),
+                    y,
+                    yrange=yrange,
+                    ls=ls,
+                    gcf=True,
+                    semilogy=True,
+                    overplot=overplot,
+                    xrange=[0.0, self._nforSn[-1]],
+                    label=label,
+                    color=color,
+                    xlabel=r"$n$",
+                    ylabel=ylabel,
+                )
             if not overplot == gs:
                 overplot = True
         if len(Es) < minn_for_cmap:
@@ -722,11 +770,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
         ta = numpy.linspace(0.0, 2.0 * numpy.pi, 1001)
         if not self._interp:
             # First find the torus for this energy
-            indx = numpy.nanargmin(numpy.fabs(E - self._Es))
-            if numpy.fabs(E - self._Es[indx]) > 1e-10:
-                raise ValueError(
-                    "Given energy not found; please specify an energy used in the initialization of the instance"
-                )
+            indx = self._find_torus(
+                E,
+                "E",
+                "Given energy not found; please specify an energy used in the initialization of the instance",
+            )
             tJ = self._js[indx]
         else:
             tJ = self.J(E)
@@ -789,11 +837,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
 
     def _coords_for_map_coords(self, E):
         coords = numpy.empty((2, self._nnSn * len(E)))
-        coords[0] = numpy.tile(
+        coords[0] = numpy.repeat(
             (E - self._Emin) / (self._Emax - self._Emin) * (self._nE - 1.0),
-            (self._nnSn, 1),
-        ).T.flatten()
-        coords[1] = numpy.tile(self._nforSn - 1, (len(E), 1)).flatten()
+            self._nnSn,
+        )
+        coords[1] = numpy.tile(self._nforSn - 1, len(E))
         return coords
 
     def nSn(self, E):
@@ -834,13 +882,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
 
     def _coords_for_map_coords_pt(self, E, deriv=False):
         coords = numpy.empty((2, (self._nptcoeffs - deriv) * len(E)))
-        coords[0] = numpy.tile(
+        coords[0] = numpy.repeat(
             (E - self._Emin) / (self._Emax - self._Emin) * (self._nE - 1.0),
-            (self._nptcoeffs - deriv, 1),
-        ).T.flatten()
-        coords[1] = numpy.tile(
-            numpy.arange(self._nptcoeffs - deriv), (len(E), 1)
-        ).flatten()
+            self._nptcoeffs - deriv,
+        )
+        coords[1] = numpy.tile(numpy.arange(self._nptcoeffs - deriv), len(E))
         return coords
 
     def pt_coeffs(self, E):
@@ -892,8 +938,9 @@ class actionAngleVerticalInverse(actionAngleInverse):
         # Check whether S_n is matched
         pyplot.subplot(2, 3, 1)
         y = numpy.fabs(self.nSn(E)[0, symm :: symm + 1])
-        ymin = numpy.amax([numpy.amin(y[numpy.isfinite(y)]), 1e-17])
-        ymax = numpy.amax(y[numpy.isfinite(y)])
+        yfinite = y[numpy.isfinite(y)]
+        ymin = numpy.amax([numpy.amin(yfinite), 1e-17])
+        ymax = numpy.amax(yfinite)
         plot.plot(
             numpy.fabs(self._nforSn[symm :: symm + 1]),
             y,
@@ -914,8 +961,9 @@ class actionAngleVerticalInverse(actionAngleInverse):
         pyplot.legend(fontsize=17.0, frameon=False)
         pyplot.subplot(2, 3, 4)
         y = ((self.nSn(E)[0] - truthaAV._nSn[0]) / truthaAV._nSn[0])[symm :: symm + 1]
-        ymin = numpy.amin(y[numpy.isfinite(y)])
-        ymax = numpy.amax(y[numpy.isfinite(y)])
+        yfinite = y[numpy.isfinite(y)]
+        ymin = numpy.amin(yfinite)
+        ymax = numpy.amax(yfinite)
         plot.plot(
             self._nforSn[symm :: symm + 1],
             y,
@@ -928,8 +976,9 @@ class actionAngleVerticalInverse(actionAngleInverse):
         # Check whether d S_n / d J is matched
         pyplot.subplot(2, 3, 2)
         y = numpy.fabs(self.dSndJ(E)[0, symm :: symm + 1])
-        ymin = numpy.amax([numpy.amin(y[numpy.isfinite(y)]), 1e-18])
-        ymax = numpy.amax(y[numpy.isfinite(y)])
+        yfinite = y[numpy.isfinite(y)]
+        ymin = numpy.amax([numpy.amin(yfinite), 1e-18])
+        ymax = numpy.amax(yfinite)
         plot.plot(
             numpy.fabs(self._nforSn[symm :: symm + 1]),
             y,
@@ -952,8 +1001,9 @@ class actionAngleVerticalInverse(actionAngleInverse):
         y = ((self.dSndJ(E)[0] - truthaAV._dSndJ[0]) / truthaAV._dSndJ[0])[
             symm :: symm + 1
         ]
-        ymin = numpy.amin(y[numpy.isfinite(y)])
-        ymax = numpy.amax(y[numpy.isfinite(y)])
+        yfinite = y[numpy.isfinite(y)]
+        ymin = numpy.amin(yfinite)
+        ymax = numpy.amax(yfinite)
         plot.plot(
             self._nforSn[symm :: symm + 1],
             y,
@@ -1003,12 +1053,12 @@ class actionAngleVerticalInverse(actionAngleInverse):
 
         Parameters
         ----------
-        E : float
+        E : float or numpy.ndarray
             Energy.
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             Action.
 
         Notes
@@ -1016,11 +1066,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
         - 2022-11-24 - Written - Bovy (UofT)
 
         """
-        indx = numpy.nanargmin(numpy.fabs(E - self._Es))
-        if numpy.fabs(E - self._Es[indx]) > 1e-10:
-            raise ValueError(
-                "Given energy not found; please specify an energy used in the initialization of the instance"
-            )
+        indx = self._find_torus(
+            E,
+            "E",
+            "Given energy not found; please specify an energy used in the initialization of the instance",
+        )
         return self._js[indx]
 
     def _evaluate(self, j, angle, **kwargs):
@@ -1067,13 +1117,14 @@ class actionAngleVerticalInverse(actionAngleInverse):
         """
         # Find torus
         if not self._interp:
-            indx = numpy.nanargmin(numpy.fabs(j - self._js))
-            if numpy.fabs(j - self._js[indx]) > 1e-10:
-                raise ValueError(
-                    "Given action/energy not found, to use interpolation, initialize with setup_interp=True"
-                )
+            indx = self._find_torus(
+                j,
+                "J",
+                "Given action/energy not found, to use interpolation, initialize with setup_interp=True",
+            )
             tnSn = self._nSn[indx]
             tdSndJ = self._dSndJ[indx]
+            tndSndJ = self._ndSndJ[indx]
             tOmegaHO = self._OmegaHO[indx]
             tOmega = self._Omegas[indx]
             txmax = self._xmaxs[indx]
@@ -1084,104 +1135,34 @@ class actionAngleVerticalInverse(actionAngleInverse):
             tE = self.E(j)
             tnSn = self.nSn(tE)[0]
             tdSndJ = self.dSndJ(tE)[0]
+            tndSndJ = self._nforSn * tdSndJ
             tOmegaHO = self.OmegaHO(tE)
             tOmega = self.Omega(tE)
             txmax = self.xmax(tE)
             tptxmax = self.ptxmax(tE)
             tptcoeffs = self.pt_coeffs(tE)[0]
             tptderivcoeffs = self.pt_deriv_coeffs(tE)[0]
-        # First we need to solve for a<nglea
+        # First we need to solve for anglea
         angle = numpy.atleast_1d(angle)
-        anglea = copy.copy(angle)
-        # Now iterate Newton's method
-        cntr = 0
-        unconv = numpy.ones(len(angle), dtype="bool")
-        ta = anglea + 2.0 * numpy.sum(
-            tdSndJ * numpy.sin(self._nforSn * numpy.atleast_2d(anglea).T), axis=1
+        anglea = _solve_anglea(
+            angle,
+            self._nforSn,
+            tdSndJ,
+            tndSndJ,
+            self._angle_tol,
+            self._maxiter,
+            self._bisect,
         )
-        dta = (ta - angle + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
-        unconv[unconv] = numpy.fabs(dta) > self._angle_tol
-        # Don't allow too big steps
-        maxda = 2.0 * numpy.pi / 101
-        while not self._bisect:
-            danglea = 1.0 + 2.0 * numpy.sum(
-                self._nforSn
-                * tdSndJ
-                * numpy.cos(self._nforSn * numpy.atleast_2d(anglea[unconv]).T),
-                axis=1,
-            )
-            dta = (ta[unconv] - angle[unconv] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
-            da = -dta / danglea
-            da[numpy.fabs(da) > maxda] = (numpy.sign(da) * maxda)[
-                numpy.fabs(da) > maxda
-            ]
-            anglea[unconv] += da
-            unconv[unconv] = numpy.fabs(dta) > self._angle_tol
-            newta = anglea[unconv] + 2.0 * numpy.sum(
-                tdSndJ * numpy.sin(self._nforSn * numpy.atleast_2d(anglea[unconv]).T),
-                axis=1,
-            )
-            ta[unconv] = newta
-            cntr += 1
-            if numpy.sum(unconv) == 0:
-                break
-            if cntr > self._maxiter:  # pragma: no cover
-                warnings.warn(
-                    "Angle mapping with Newton-Raphson did not converge in {} iterations, falling back onto simple bisection (increase maxiter to try harder with Newton-Raphson)".format(
-                        self._maxiter
-                    ),
-                    galpyWarning,
-                )
-                break
-        # Fallback onto simple bisection in case of non-convergence
-        if self._bisect or cntr > self._maxiter:
-            # Reset cntr
-            cntr = 0
-            trya_min = numpy.zeros(numpy.sum(unconv))
-            da = 2.0 * numpy.pi
-            while True:
-                da *= 0.5
-                anglea[unconv] = trya_min + da
-                newta = (
-                    anglea[unconv]
-                    + 2.0
-                    * numpy.sum(
-                        tdSndJ
-                        * numpy.sin(self._nforSn * numpy.atleast_2d(anglea[unconv]).T),
-                        axis=1,
-                    )
-                    + 2.0 * numpy.pi
-                ) % (2.0 * numpy.pi)
-                dta = (newta - angle[unconv] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
-                trya_min[newta < angle[unconv]] = anglea[unconv][newta < angle[unconv]]
-                unconv[unconv] = numpy.fabs(dta) > self._angle_tol
-                trya_min = trya_min[numpy.fabs(dta) > self._angle_tol]
-                cntr += 1
-                if numpy.sum(unconv) == 0:
-                    break
-                if cntr > self._maxiter:  # pragma: no cover
-                    warnings.warn(
-                        "Angle mapping with bisection did not converge in {} iterations".format(
-                            self._maxiter
-                        )
-                        + " for angles:"
-                        + "".join(f" {k:g}" for k in sorted(set(angle[unconv]))),
-                        galpyWarning,
-                    )
-                    break
         # Then compute the auxiliary action
-        ja = j + 2.0 * numpy.sum(
-            tnSn * numpy.cos(self._nforSn * numpy.atleast_2d(anglea).T), axis=1
-        )
-        hoaainv = actionAngleHarmonicInverse(omega=tOmegaHO)
-        xa, va = hoaainv(ja, anglea)
-        x = txmax * polynomial.polyval((xa / tptxmax).T, tptcoeffs.T, tensor=False).T
-        v = (
-            va
-            / tptxmax
-            * txmax
-            * polynomial.polyval((xa / tptxmax).T, tptderivcoeffs.T, tensor=False).T
-        )
+        ja = j + 2.0 * numpy.dot(numpy.cos(numpy.outer(anglea, self._nforSn)), tnSn)
+        # Harmonic-oscillator (x,v) in closed form, as in
+        # actionAngleHarmonicInverse, without the overhead of its __call__
+        amp = numpy.sqrt(2.0 * ja / tOmegaHO)
+        xa = amp * numpy.sin(anglea)
+        va = amp * tOmegaHO * numpy.cos(anglea)
+        pt, ptderiv = _polyvals(xa / tptxmax, tptcoeffs, tptderivcoeffs)
+        x = txmax * pt
+        v = va / tptxmax * txmax * ptderiv
         return (x, v, tOmega)
 
     def _Freqs(self, j, **kwargs):
@@ -1190,12 +1171,12 @@ class actionAngleVerticalInverse(actionAngleInverse):
 
         Parameters
         ----------
-        j : float
+        j : float or numpy.ndarray
             Action.
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             Frequency corresponding to a torus.
 
         Notes
@@ -1205,11 +1186,11 @@ class actionAngleVerticalInverse(actionAngleInverse):
         """
         # Find torus
         if not self._interp:
-            indx = numpy.nanargmin(numpy.fabs(j - self._js))
-            if numpy.fabs(j - self._js[indx]) > 1e-10:
-                raise ValueError(
-                    "Given action/energy not found, to use interpolation, initialize with setup_interp=True"
-                )
+            indx = self._find_torus(
+                j,
+                "J",
+                "Given action/energy not found, to use interpolation, initialize with setup_interp=True",
+            )
             tOmega = self._Omegas[indx]
         else:
             tE = self.E(j)
@@ -1217,6 +1198,212 @@ class actionAngleVerticalInverse(actionAngleInverse):
         return tOmega
 
 
+def _xmax(pot, E, aAV, maxiter=100):
+    """
+    Compute the maximum height of the orbits with a given set of energies
+
+    Parameters
+    ----------
+    pot : Potential object
+        The potential.
+    E : numpy.ndarray
+        Energies.
+    aAV : actionAngleVertical instance
+        Used to compute xmax for energies for which the vectorized root-finding fails.
+    maxiter : int, optional
+        Maximum number of iterations of the vectorized root-finding. Default is 100.
+
+    Returns
+    -------
+    numpy.ndarray
+        Maximum heights (zero for E <= Phi(0), -9999.99 when xmax > 100 like actionAngleVertical.calcxmax).
+
+    """
+    phi0 = evaluatelinearPotentials(pot, 0.0)
+    out = numpy.zeros_like(E)
+    gIndx = (E - phi0) >= 1e-14
+    tE = E[gIndx]
+    # Bracket the turning point like actionAngleVertical.calcxmax does
+    xhi = numpy.full_like(tE, 0.00001)
+    unbracketed = (tE - evaluatelinearPotentials(pot, xhi)) > 0.0
+    while numpy.any(unbracketed * (xhi <= 100.0)):
+        indx = unbracketed * (xhi <= 100.0)
+        xhi[indx] *= 2.0
+        unbracketed[indx] = (tE[indx] - evaluatelinearPotentials(pot, xhi[indx])) > 0.0
+    unbracketed[xhi > 100.0] = True
+    xlo = 0.5 * xhi
+    xlo[xhi == 0.00001] = 0.0
+    # Start Newton-Raphson from inverse interpolation of a table of the
+    # potential over the bracketed range, which is evaluated in one call
+    x = copy.copy(xhi)
+    unconv = True ^ unbracketed
+    if numpy.any(unconv):
+        xtable = numpy.linspace(0.0, numpy.amax(xhi[unconv]), 257)
+        phitable = numpy.maximum.accumulate(evaluatelinearPotentials(pot, xtable))
+        x[unconv] = numpy.clip(
+            numpy.interp(tE[unconv], phitable, xtable), xlo[unconv], xhi[unconv]
+        )
+    # Newton-Raphson for all energies at once, safeguarded by bisection
+    cntr = 0
+    while numpy.any(unconv) and cntr < maxiter:
+        tx = x[unconv]
+        f = evaluatelinearPotentials(pot, tx) - tE[unconv]
+        tlo, thi = xlo[unconv], xhi[unconv]
+        tlo[f < 0.0] = tx[f < 0.0]
+        thi[f > 0.0] = tx[f > 0.0]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            newx = tx + f / evaluatelinearForces(pot, tx)
+        bisect = (True ^ numpy.isfinite(newx)) | (newx <= tlo) | (newx >= thi)
+        newx[bisect] = 0.5 * (tlo[bisect] + thi[bisect])
+        xlo[unconv], xhi[unconv], x[unconv] = tlo, thi, newx
+        unconv[unconv] = (f != 0.0) * (
+            numpy.fabs(newx - tx) > 1e-14 * numpy.maximum(1.0, tx)
+        )
+        cntr += 1
+    # Make sure that we are inside the orbit
+    outside = (tE - evaluatelinearPotentials(pot, x)) < 0.0
+    outside[unbracketed] = False
+    cntr = 0
+    while numpy.any(outside) and cntr < 10:
+        x[outside] -= numpy.maximum(1e-14, numpy.spacing(x[outside]))
+        outside[outside] = (
+            tE[outside] - evaluatelinearPotentials(pot, x[outside])
+        ) < 0.0
+        cntr += 1
+    unconv |= outside
+    # Fall back onto actionAngleVertical.calcxmax where this fails
+    for ii in numpy.arange(len(tE))[unbracketed | unconv]:
+        x[ii] = aAV.calcxmax(0.0, numpy.sqrt(2.0 * (tE[ii] - phi0)), E=tE[ii])
+    out[gIndx] = x
+    return out
+
+
+def _wrap_angle_diff(a, b, out=None):
+    """Difference a-b of two angles wrapped to [-pi,pi), computed in place in out (optional) to avoid temporary arrays"""
+    out = numpy.subtract(a, b, out=out)
+    out += numpy.pi
+    numpy.mod(out, 2.0 * numpy.pi, out=out)
+    out -= numpy.pi
+    return out
+
+
+def _polyvals(x, *cs):
+    """Evaluate several polynomials at x in a single in-place Horner loop; the coefficients of each are along the last axis of c (lowest order first, like numpy.polynomial.polynomial.polyval with tensor=False) and broadcast against x"""
+    outs = [
+        numpy.zeros(numpy.broadcast_shapes(numpy.shape(x), c.shape[:-1])) for c in cs
+    ]
+    for ii in range(max(c.shape[-1] for c in cs) - 1, -1, -1):
+        for out, c in zip(outs, cs):
+            if ii < c.shape[-1]:
+                out *= x
+                out += c[..., ii]
+    return tuple(outs)
+
+
+def _solve_anglea(angle, nforSn, dSndJ, ndSndJ, tol, maxiter, bisect):
+    """
+    Solve angle = anglea + 2 sum_n dS_n/dJ sin(n anglea) for the auxiliary angle
+
+    Parameters
+    ----------
+    angle : numpy.ndarray
+        Angles.
+    nforSn : numpy.ndarray
+        Orders n of the Fourier coefficients.
+    dSndJ : numpy.ndarray
+        Fourier coefficients dS_n/dJ of the torus.
+    ndSndJ : numpy.ndarray
+        n dS_n/dJ.
+    tol : float
+        Tolerance on the angle.
+    maxiter : int
+        Maximum number of iterations of Newton-Raphson and of bisection.
+    bisect : bool
+        If True, directly use bisection rather than Newton-Raphson.
+
+    Returns
+    -------
+    numpy.ndarray
+        Auxiliary angles.
+
+    Notes
+    -----
+    - 2018-04-15 - Written as part of actionAngleVerticalInverse._xvFreqs - Bovy (UofT)
+
+    """
+    anglea = copy.copy(angle)
+    # The Fourier sums are matrix-vector products of the (angle,n) sin/cos
+    # matrix with the coefficients; the phases n x anglea are shared between
+    # the residual (sin) and its derivative (cos) at the same anglea
+    phase = numpy.outer(anglea, nforSn)
+    ta = anglea + 2.0 * numpy.dot(numpy.sin(phase), dSndJ)
+    dta = _wrap_angle_diff(ta, angle)
+    # Iterate on compact arrays of the unconverged angles, rather than masking
+    # the full arrays multiple times in every iteration
+    indx = numpy.nonzero(numpy.fabs(dta) > tol)[0]
+    ua, uta, uangle, phase = anglea[indx], ta[indx], angle[indx], phase[indx]
+    # Now iterate Newton's method
+    cntr = 0
+    # Don't allow too big steps
+    maxda = 2.0 * numpy.pi / 101
+    while not bisect and len(indx) > 0:
+        danglea = 1.0 + 2.0 * numpy.dot(numpy.cos(phase), ndSndJ)
+        dta = _wrap_angle_diff(uta, uangle, out=uta)
+        da = -dta / danglea
+        numpy.clip(da, -maxda, maxda, out=da)
+        ua += da
+        anglea[indx] = ua
+        stillunconv = numpy.fabs(dta) > tol
+        indx, ua, uangle = indx[stillunconv], ua[stillunconv], uangle[stillunconv]
+        phase = numpy.outer(ua, nforSn)
+        uta = ua + 2.0 * numpy.dot(numpy.sin(phase), dSndJ)
+        cntr += 1
+        if len(indx) == 0:
+            break
+        if cntr > maxiter:  # pragma: no cover
+            warnings.warn(
+                "Angle mapping with Newton-Raphson did not converge in {} iterations, falling back onto simple bisection (increase maxiter to try harder with Newton-Raphson)".format(
+                    maxiter
+                ),
+                galpyWarning,
+            )
+            break
+    # Fallback onto simple bisection in case of non-convergence
+    if bisect or cntr > maxiter:
+        # Reset cntr
+        cntr = 0
+        trya_min = numpy.zeros(len(indx))
+        da = 2.0 * numpy.pi
+        while len(indx) > 0:
+            da *= 0.5
+            ua = trya_min + da
+            anglea[indx] = ua
+            newta = (
+                ua
+                + 2.0 * numpy.dot(numpy.sin(numpy.outer(ua, nforSn)), dSndJ)
+                + 2.0 * numpy.pi
+            ) % (2.0 * numpy.pi)
+            dta = _wrap_angle_diff(newta, uangle)
+            trya_min[newta < uangle] = ua[newta < uangle]
+            stillunconv = numpy.fabs(dta) > tol
+            indx, uangle = indx[stillunconv], uangle[stillunconv]
+            trya_min = trya_min[stillunconv]
+            cntr += 1
+            if len(indx) == 0:
+                break
+            if cntr > maxiter:  # pragma: no cover
+                warnings.warn(
+                    "Angle mapping with bisection did not converge in {} iterations".format(
+                        maxiter
+                    )
+                    + " for angles:"
+                    + "".join(f" {k:g}" for k in sorted(set(uangle))),
+                    galpyWarning,
+                )
+                break
+    return anglea
+
+
 def _anglea(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax, vsign=1.0):
     """
     Compute the auxiliary angle in the harmonic-oscillator for a grid in x and E
@@ -1239,7 +1426,7 @@ def _anglea(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax, vsign=1.0)
         Xmax of the true torus.
     ptxmax : float
         Xmax of the point-transformed torus.
-    vsign : float, optional
+    vsign : float or numpy.ndarray, optional
         Sign of the velocity. Default is 1.0.
 
     Returns
@@ -1254,24 +1441,15 @@ def _anglea(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax, vsign=1.0)
 
     """
     # Compute v
-    x = xmax * polynomial.polyval((xa / ptxmax).T, ptcoeffs.T, tensor=False).T
+    pt, ptderiv = _polyvals(xa / ptxmax, ptcoeffs, ptderivcoeffs)
+    x = xmax * pt
     v2 = 2.0 * (E - evaluatelinearPotentials(pot, x))
-    v2[v2 < 0] = 0.0
+    numpy.maximum(v2, 0.0, out=v2)
     v2[numpy.fabs(xa) == ptxmax] = 0.0  # just in case the pt mapping has small issues
-    piprime = (
-        xmax
-        / ptxmax
-        * polynomial.polyval((xa / ptxmax).T, ptderivcoeffs.T, tensor=False).T
-    )
+    piprime = xmax / ptxmax * ptderiv
     # J=0 special case:
-    piprime[(xmax == 0.0) * (ptxmax == xmax + 1e-10)] = polynomial.polyval(
-        (
-            xa[(xmax == 0.0) * (ptxmax == xmax + 1e-10)]
-            / ptxmax[(xmax == 0.0) * (ptxmax == xmax + 1e-10)]
-        ).T,
-        ptderivcoeffs[(xmax == 0.0) * (ptxmax == xmax + 1e-10)].T,
-        tensor=False,
-    ).T
+    zeroJ = (xmax == 0.0) * (ptxmax == xmax + 1e-10)
+    piprime[zeroJ] = ptderiv[zeroJ]
     return numpy.arctan2(omega * xa, vsign * numpy.sqrt(v2) / piprime)
 
 
@@ -1301,7 +1479,7 @@ def _danglea(
         Xmax of the true torus.
     ptxmax : float
         Xmax of the point-transformed torus.
-    vsign : float, optional
+    vsign : float or numpy.ndarray, optional
         Sign of the velocity. Default is 1.0.
 
     Returns
@@ -1316,30 +1494,87 @@ def _danglea(
 
     """
     # Compute v
-    x = xmax * polynomial.polyval((xa / ptxmax).T, ptcoeffs.T, tensor=False).T
+    pt, ptderiv, ptderiv2 = _polyvals(
+        xa / ptxmax, ptcoeffs, ptderivcoeffs, ptderiv2coeffs
+    )
+    x = xmax * pt
     v2 = 2.0 * (E - evaluatelinearPotentials(pot, x))
-    v2[v2 < 1e-15] = 1e-15
-    piprime = (
-        xmax
-        / ptxmax
-        * polynomial.polyval((xa / ptxmax).T, ptderivcoeffs.T, tensor=False).T
+    numpy.maximum(v2, 1e-15, out=v2)
+    piprime = xmax / ptxmax * ptderiv
+    piprime2 = xmax / ptxmax**2.0 * ptderiv2
+    # omega cos^2(anglea) / v^3 with cos^2(anglea) = v^2 / ((omega xa pi')^2 + v^2)
+    # for anglea = arctan2(omega xa pi', +/-v), avoiding the trig and pow calls
+    return (
+        omega
+        / (((omega * xa * piprime) ** 2.0 + v2) * numpy.sqrt(v2))
+        * (
+            v2 * (piprime + xa * piprime2)
+            - xa * evaluatelinearForces(pot, x) * piprime**2.0
+        )
     )
-    anglea = numpy.arctan2(omega * xa * piprime, vsign * numpy.sqrt(v2))
 
-    piprime2 = (
-        xmax
-        / ptxmax**2.0
-        * polynomial.polyval((xa / ptxmax).T, ptderiv2coeffs.T, tensor=False).T
+
+def _anglea_danglea(
+    xa, E, pot, omega, ptcoeffs, ptderivcoeffs, ptderiv2coeffs, xmax, ptxmax, vsign=1.0
+):
+    """
+    Compute the auxiliary angle in the harmonic-oscillator and its derivative wrt x for a grid in x and E (the combination of _anglea and _danglea)
+
+    Parameters
+    ----------
+    xa : numpy.ndarray
+        Position.
+    E : float
+        Energy.
+    pot : Potential object
+        The potential.
+    omega : numpy.ndarray
+        Harmonic-oscillator frequencies.
+    ptcoeffs : numpy.ndarray
+        Coefficients of the polynomial point transformation.
+    ptderivcoeffs : numpy.ndarray
+        Coefficients of the derivative of the polynomial point transformation.
+    ptderiv2coeffs : numpy.ndarray
+        Coefficients of the second derivative of the polynomial point transformation.
+    xmax : float
+        Xmax of the true torus.
+    ptxmax : float
+        Xmax of the point-transformed torus.
+    vsign : float or numpy.ndarray, optional
+        Sign of the velocity. Default is 1.0.
+
+    Returns
+    -------
+    tuple
+        (auxiliary angles, d auxiliary angles / d x)
+
+    """
+    pt, ptderiv, ptderiv2 = _polyvals(
+        xa / ptxmax, ptcoeffs, ptderivcoeffs, ptderiv2coeffs
     )
-    return (
+    x = xmax * pt
+    v2 = 2.0 * (E - evaluatelinearPotentials(pot, x))
+    piprime = xmax / ptxmax * ptderiv
+    # Angle, as in _anglea
+    av2 = numpy.maximum(v2, 0.0)
+    av2[numpy.fabs(xa) == ptxmax] = 0.0
+    apiprime = copy.copy(piprime)
+    # J=0 special case:
+    zeroJ = (xmax == 0.0) * (ptxmax == xmax + 1e-10)
+    apiprime[zeroJ] = ptderiv[zeroJ]
+    anglea = numpy.arctan2(omega * xa, vsign * numpy.sqrt(av2) / apiprime)
+    # Derivative, as in _danglea
+    numpy.maximum(v2, 1e-15, out=v2)
+    piprime2 = xmax / ptxmax**2.0 * ptderiv2
+    danglea = (
         omega
-        * numpy.cos(anglea) ** 2.0
-        * v2**-1.5
+        / (((omega * xa * piprime) ** 2.0 + v2) * numpy.sqrt(v2))
         * (
             v2 * (piprime + xa * piprime2)
             - xa * evaluatelinearForces(pot, x) * piprime**2.0
         )
     )
+    return (anglea, danglea)
 
 
 def _ja(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax):
@@ -1376,14 +1611,11 @@ def _ja(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax):
     - 2018-11-22 - Added point transformation - Bovy (UofT)
 
     """
-    x = xmax * polynomial.polyval((xa / ptxmax).T, ptcoeffs.T, tensor=False).T
+    pt, ptderiv = _polyvals(xa / ptxmax, ptcoeffs, ptderivcoeffs)
+    x = xmax * pt
     v2over2 = E - evaluatelinearPotentials(pot, x)
-    v2over2[v2over2 < 0.0] = 0.0
-    piprime = (
-        xmax
-        / ptxmax
-        * polynomial.polyval((xa / ptxmax).T, ptderivcoeffs.T, tensor=False).T
-    )
+    numpy.maximum(v2over2, 0.0, out=v2over2)
+    piprime = xmax / ptxmax * ptderiv
     out = numpy.empty_like(xa)
     gIndx = True ^ ((xmax == 0.0) * (ptxmax == xmax + 1e-10))
     out[gIndx] = (
@@ -1395,6 +1627,78 @@ def _ja(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, xmax, ptxmax):
     return out
 
 
+def _ja_djadj(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, ptderiv2coeffs, xmax, ptxmax):
+    """
+    Compute the auxiliary action in the harmonic-oscillator and its derivative wrt the action for a grid in x and E (the combination of _ja and _djadj)
+
+    Parameters
+    ----------
+    xa : numpy.ndarray
+        position
+    E : numpy.ndarray
+        Energy
+    pot : Potential object
+        the potential
+    omega : numpy.ndarray
+        harmonic-oscillator frequencies
+    ptcoeffs : numpy.ndarray
+        coefficients of the polynomial point transformation
+    ptderivcoeffs : numpy.ndarray
+        coefficients of the derivative of the polynomial point transformation
+    ptderiv2coeffs : numpy.ndarray
+        coefficients of the second derivative of the polynomial point transformation
+    xmax : float
+        xmax of the true torus
+    ptxmax : float
+        xmax of the point-transformed torus
+
+    Returns
+    -------
+    numpy.ndarray
+        Auxiliary actions and d(auxiliary actions)/d(action), stacked in one (2,...) array.
+
+    """
+    pt, ptderiv, ptderiv2 = _polyvals(
+        xa / ptxmax, ptcoeffs, ptderivcoeffs, ptderiv2coeffs
+    )
+    x = xmax * pt
+    v2over2 = E - evaluatelinearPotentials(pot, x)
+    v2 = 2.0 * v2over2
+    piprime = xmax / ptxmax * ptderiv
+    piprime2 = xmax / ptxmax**2.0 * ptderiv2
+    zeroJ = (xmax == 0.0) * (ptxmax == xmax + 1e-10)
+    gIndx = True ^ zeroJ
+    # Action, as in _ja
+    numpy.maximum(v2over2, 0.0, out=v2over2)
+    # Both outputs are written into one contiguous buffer
+    out = numpy.empty((2,) + xa.shape)
+    ja, djadj = out
+    ja[gIndx] = (
+        v2over2[gIndx] / omega[gIndx] / piprime[gIndx] ** 2.0
+        + omega[gIndx] * xa[gIndx] ** 2.0 / 2.0
+    )
+    # J=0 special case
+    ja[zeroJ] = 0.0
+    # Derivative, as in _djadj
+    piprime[zeroJ] = _polyvals(x[zeroJ] / ptxmax[zeroJ], ptderivcoeffs[zeroJ])[0]
+    force = evaluatelinearForces(pot, x)
+    dxAdE = numpy.empty_like(xa)
+    dxAdE[gIndx] = (
+        xa[gIndx]
+        * piprime[gIndx] ** 2.0
+        / (
+            v2[gIndx] * (1.0 + piprime2[gIndx] / piprime[gIndx] * xa[gIndx])
+            - xa[gIndx] * force[gIndx] * piprime[gIndx]
+        )
+    )
+    dxAdE[zeroJ] = 1.0
+    djadj[:] = (
+        1.0
+        + (force / piprime + omega**2.0 * xa - piprime**-3.0 * piprime2 * v2) * dxAdE
+    )
+    return out
+
+
 def _djadj(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, ptderiv2coeffs, xmax, ptxmax):
     """
     Compute the derivative of the auxiliary action in the harmonic-oscillator wrt the action for a grid in x and E
@@ -1430,44 +1734,30 @@ def _djadj(xa, E, pot, omega, ptcoeffs, ptderivcoeffs, ptderiv2coeffs, xmax, ptx
     - 2018-04-14 - Written - Bovy (UofT)
     - 2018-11-23 - Added point transformation - Bovy (UofT)
     """
-    x = xmax * polynomial.polyval((xa / ptxmax).T, ptcoeffs.T, tensor=False).T
-    v2 = 2.0 * (E - evaluatelinearPotentials(pot, x))
-    piprime = (
-        xmax
-        / ptxmax
-        * polynomial.polyval((xa / ptxmax).T, ptderivcoeffs.T, tensor=False).T
-    )
-    piprime2 = (
-        xmax
-        / ptxmax**2.0
-        * polynomial.polyval((xa / ptxmax).T, ptderiv2coeffs.T, tensor=False).T
+    pt, ptderiv, ptderiv2 = _polyvals(
+        xa / ptxmax, ptcoeffs, ptderivcoeffs, ptderiv2coeffs
     )
+    x = xmax * pt
+    v2 = 2.0 * (E - evaluatelinearPotentials(pot, x))
+    piprime = xmax / ptxmax * ptderiv
+    piprime2 = xmax / ptxmax**2.0 * ptderiv2
     # J=0 special case:
-    piprime[(xmax == 0.0) * (ptxmax == xmax + 1e-10)] = polynomial.polyval(
-        (
-            x[(xmax == 0.0) * (ptxmax == xmax + 1e-10)]
-            / ptxmax[(xmax == 0.0) * (ptxmax == xmax + 1e-10)]
-        ).T,
-        ptderivcoeffs[(xmax == 0.0) * (ptxmax == xmax + 1e-10)].T,
-        tensor=False,
-    ).T
-    gIndx = True ^ ((xmax == 0.0) * (ptxmax == xmax + 1e-10))
+    zeroJ = (xmax == 0.0) * (ptxmax == xmax + 1e-10)
+    piprime[zeroJ] = _polyvals(x[zeroJ] / ptxmax[zeroJ], ptderivcoeffs[zeroJ])[0]
+    gIndx = True ^ zeroJ
+    # The force at x is needed twice below, only evaluate it once
+    force = evaluatelinearForces(pot, x)
     dxAdE = numpy.empty_like(xa)
     dxAdE[gIndx] = (
         xa[gIndx]
         * piprime[gIndx] ** 2.0
         / (
             v2[gIndx] * (1.0 + piprime2[gIndx] / piprime[gIndx] * xa[gIndx])
-            - xa[gIndx] * evaluatelinearForces(pot, x[gIndx]) * piprime[gIndx]
+            - xa[gIndx] * force[gIndx] * piprime[gIndx]
         )
     )
-    dxAdE[(xmax == 0.0) * (ptxmax == xmax + 1e-10)] = 1.0
+    dxAdE[zeroJ] = 1.0
     return (
         1.0
-        + (
-            evaluatelinearForces(pot, x) / piprime
-            + omega**2.0 * xa
-            - piprime**-3.0 * piprime2 * v2
-        )
-        * dxAdE
+        + (force / piprime + omega**2.0 * xa - piprime**-3.0 * piprime2 * v2) * dxAdE
     )
@@ -45,18 +45,18 @@ class galpy_profile(LiteratureReferencesMixIn):
         self.ro = ro
         self.vo = vo
         self.reverse = reverse
+        # Conversion factors are constant over the life of the object
+        self._roinv = 1.0 / ro
+        self._time_conv = conversion.time_in_Gyr(ro=ro, vo=vo)
+        self._force_conv = conversion.force_in_kmsMyr(ro=ro, vo=vo)
         # Initialize model time
         if isinstance(t, ScalarQuantity):
             self.model_time = t
         else:
-            self.model_time = (
-                t * conversion.time_in_Gyr(ro=self.ro, vo=self.vo) | units.Gyr
-            )
+            self.model_time = t * self._time_conv | units.Gyr
         # Initialize galpy time
         if isinstance(tgalpy, ScalarQuantity):
-            self.tgalpy = tgalpy.value_in(units.Gyr) / conversion.time_in_Gyr(
-                ro=self.ro, vo=self.vo
-            )
+            self.tgalpy = tgalpy.value_in(units.Gyr) / self._time_conv
         else:
             self.tgalpy = tgalpy
 
@@ -81,13 +81,18 @@ class galpy_profile(LiteratureReferencesMixIn):
         dt = time - self.model_time
         self.model_time = time
         if self.reverse:
-            self.tgalpy -= dt.value_in(units.Gyr) / conversion.time_in_Gyr(
-                ro=self.ro, vo=self.vo
-            )
+            self.tgalpy -= dt.value_in(units.Gyr) / self._time_conv
         else:
-            self.tgalpy += dt.value_in(units.Gyr) / conversion.time_in_Gyr(
-                ro=self.ro, vo=self.vo
-            )
+            self.tgalpy += dt.value_in(units.Gyr) / self._time_conv
+
+    def _cyl_coords(self, x, y, z):
+        """Convert (arrays of) AMUSE positions to galpy's internal cylindrical coordinates (R,z,phi), converting each coordinate once"""
+        x, y = x.value_in(units.kpc), y.value_in(units.kpc)
+        return (
+            numpy.hypot(x, y) * self._roinv,
+            z.value_in(units.kpc) * self._roinv,
+            numpy.arctan2(y, x),
+        )
 
     def get_potential_at_point(self, eps, x, y, z):
         """
@@ -111,13 +116,11 @@ class galpy_profile(LiteratureReferencesMixIn):
         - 2019-11-06 - Added physical compatibility - Starkman (UofT).
 
         """
-        R = numpy.sqrt(x.value_in(units.kpc) ** 2.0 + y.value_in(units.kpc) ** 2.0)
-        zed = z.value_in(units.kpc)
-        phi = numpy.arctan2(y.value_in(units.kpc), x.value_in(units.kpc))
+        R, zed, phi = self._cyl_coords(x, y, z)
         res = potential.evaluatePotentials(
             self.pot,
-            R / self.ro,
-            zed / self.ro,
+            R,
+            zed,
             phi=phi,
             t=self.tgalpy,
             ro=self.ro,
@@ -152,46 +155,40 @@ class galpy_profile(LiteratureReferencesMixIn):
         - 2019-11-06 - Added physical compatibility - Starkman (UofT).
 
         """
-        R = numpy.sqrt(x.value_in(units.kpc) ** 2.0 + y.value_in(units.kpc) ** 2.0)
-        zed = z.value_in(units.kpc)
-        phi = numpy.arctan2(y.value_in(units.kpc), x.value_in(units.kpc))
+        R, zed, phi = self._cyl_coords(x, y, z)
         # Cylindrical force
         Rforce = potential.evaluateRforces(
             self.pot,
-            R / self.ro,
-            zed / self.ro,
+            R,
+            zed,
             phi=phi,
             t=self.tgalpy,
             use_physical=False,
         )
-        phitorque = potential.evaluatephitorques(
-            self.pot,
-            R / self.ro,
-            zed / self.ro,
-            phi=phi,
-            t=self.tgalpy,
-            use_physical=False,
-        ) / (R / self.ro)
+        phitorque = (
+            potential.evaluatephitorques(
+                self.pot,
+                R,
+                zed,
+                phi=phi,
+                t=self.tgalpy,
+                use_physical=False,
+            )
+            / R
+        )
         zforce = potential.evaluatezforces(
             self.pot,
-            R / self.ro,
-            zed / self.ro,
+            R,
+            zed,
             phi=phi,
             t=self.tgalpy,
             use_physical=False,
         )
         # Convert cylindrical force --> rectangular
         cp, sp = numpy.cos(phi), numpy.sin(phi)
-        ax = (Rforce * cp - phitorque * sp) * conversion.force_in_kmsMyr(
-            ro=self.ro, vo=self.vo
-        ) | units.kms / units.Myr
-        ay = (Rforce * sp + phitorque * cp) * conversion.force_in_kmsMyr(
-            ro=self.ro, vo=self.vo
-        ) | units.kms / units.Myr
-        az = (
-            zforce * conversion.force_in_kmsMyr(ro=self.ro, vo=self.vo)
-            | units.kms / units.Myr
-        )
+        ax = (Rforce * cp - phitorque * sp) * self._force_conv | units.kms / units.Myr
+        ay = (Rforce * sp + phitorque * cp) * self._force_conv | units.kms / units.Myr
+        az = zforce * self._force_conv | units.kms / units.Myr
         return ax, ay, az
 
     def mass_density(self, x, y, z):
@@ -216,13 +213,11 @@ class galpy_profile(LiteratureReferencesMixIn):
         - 2019-11-06 - added physical compatibility - Starkman (UofT)
 
         """
-        R = numpy.sqrt(x.value_in(units.kpc) ** 2.0 + y.value_in(units.kpc) ** 2.0)
-        zed = z.value_in(units.kpc)
-        phi = numpy.arctan2(y.value_in(units.kpc), x.value_in(units.kpc))
+        R, zed, phi = self._cyl_coords(x, y, z)
         res = potential.evaluateDensities(
             self.pot,
-            R / self.ro,
-            zed / self.ro,
+            R,
+            zed,
             phi=phi,
             t=self.tgalpy,
             ro=self.ro,
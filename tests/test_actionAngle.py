@@ -7040,6 +7040,111 @@ def test_actionAngleVerticalInverse_notE_errors():
     return None
 
 
+# Test that actionAngleVerticalInverse gives the same tori for unsorted energies
+def test_actionAngleVerticalInverse_unsortedEs():
+    from galpy.actionAngle import actionAngleVerticalInverse
+    from galpy.potential import IsothermalDiskPotential
+
+    isopot = IsothermalDiskPotential(amp=1.0, sigma=0.5)
+    aAVI = actionAngleVerticalInverse(
+        pot=isopot, nta=128, Es=[0.1, 1.0, 10.0], use_pointtransform=True
+    )
+    aAVIu = actionAngleVerticalInverse(
+        pot=isopot, nta=128, Es=[10.0, 0.1, 1.0], use_pointtransform=True
+    )
+    for attr in ["_Es", "_js", "_Omegas", "_xmaxs", "_pt_coeffs", "_nSn", "_dSndJ"]:
+        assert numpy.amax(numpy.fabs(getattr(aAVI, attr) - getattr(aAVIu, attr))) < (
+            1e-10
+        ), (
+            f"actionAngleVerticalInverse {attr} depends on the order of the input energies"
+        )
+    ta = numpy.linspace(0.0, 2.0 * numpy.pi, 101)
+    for E in [0.1, 1.0, 10.0]:
+        x, v = aAVI(aAVI.J(E), ta)
+        xu, vu = aAVIu(aAVIu.J(E), ta)
+        assert numpy.amax(numpy.fabs(x - xu)) < 1e-10, (
+            "actionAngleVerticalInverse torus depends on the order of the input energies"
+        )
+        assert numpy.amax(numpy.fabs(v - vu)) < 1e-10, (
+            "actionAngleVerticalInverse torus depends on the order of the input energies"
+        )
+    return None
+
+
+# Test that the vectorized xmax in actionAngleVerticalInverse agrees with
+# actionAngleVertical.calcxmax
+def test_actionAngleVerticalInverse_xmax_wrtVertical():
+    from galpy.actionAngle import actionAngleVertical
+    from galpy.actionAngle.actionAngleVerticalInverse import _xmax
+    from galpy.potential import (
+        IsothermalDiskPotential,
+        KGPotential,
+        MWPotential2014,
+        evaluatelinearPotentials,
+        toVerticalPotential,
+    )
+
+    for pot in [
+        IsothermalDiskPotential(amp=1.0, sigma=0.5),
+        KGPotential(),
+        toVerticalPotential(MWPotential2014, 1.0),
+    ]:
+        aAV = actionAngleVertical(pot=pot)
+        phi0 = evaluatelinearPotentials(pot, 0.0)
+        # Includes E <= Phi(0) and energies too large to bracket xmax < 100
+        Es = phi0 + numpy.concatenate(
+            [[-0.1, 0.0, 1e-15], numpy.linspace(1e-6, 4.0, 41), [50.0, 300.0]]
+        )
+        xmaxs_direct = numpy.array(
+            [
+                0.0
+                if E - phi0 < 1e-14
+                else aAV.calcxmax(0.0, numpy.sqrt(2.0 * (E - phi0)), E=E)
+                for E in Es
+            ]
+        )
+        # Vectorized Newton-Raphson and the calcxmax fallback (maxiter=0)
+        for maxiter in [100, 0]:
+            xmaxs = _xmax(pot, Es, aAV, maxiter=maxiter)
+            assert numpy.amax(numpy.fabs(xmaxs - xmaxs_direct)) < 1e-12, (
+                "Vectorized xmax in actionAngleVerticalInverse does not agree with actionAngleVertical.calcxmax"
+            )
+            assert numpy.all(
+                Es[xmaxs > 0.0] - evaluatelinearPotentials(pot, xmaxs[xmaxs > 0.0])
+                >= 0.0
+            ), "Vectorized xmax in actionAngleVerticalInverse is outside of the orbit"
+        assert numpy.all(xmaxs[:3] == 0.0), (
+            "Vectorized xmax in actionAngleVerticalInverse is not zero for E <= Phi(0)"
+        )
+    return None
+
+
+# Test that actionAngleVerticalInverse's J and Freqs work for arrays of tori
+def test_actionAngleVerticalInverse_arrayJFreqs():
+    from galpy.actionAngle import actionAngleVerticalInverse
+    from galpy.potential import IsothermalDiskPotential
+
+    isopot = IsothermalDiskPotential(amp=1.0, sigma=0.5)
+    Es = [0.1, 0.3, 1.0, 3.0]
+    aAVI = actionAngleVerticalInverse(pot=isopot, nta=32, Es=Es)
+    tEs = numpy.array([1.0, 0.1, 3.0 + 1e-12, 1.0, 0.3])
+    js = aAVI.J(tEs)
+    assert numpy.all(
+        js == numpy.array([aAVI.J(E) for E in [1.0, 0.1, 3.0, 1.0, 0.3]])
+    ), (
+        "actionAngleVerticalInverse J for an array of energies does not agree with J for each energy"
+    )
+    Oms = aAVI.Freqs(js)
+    assert numpy.all(Oms == numpy.array([aAVI.Freqs(j) for j in js])), (
+        "actionAngleVerticalInverse Freqs for an array of actions does not agree with Freqs for each action"
+    )
+    with pytest.raises(ValueError) as excinfo:
+        aAVI.J(numpy.array([0.1, 0.2]))
+    with pytest.raises(ValueError) as excinfo:
+        aAVI.Freqs(numpy.array([js[0], 0.11]))
+    return None
+
+
 # Test that computing actionAngle coordinates in C for a NullPotential leads to an error
 def test_nullpotential_error():
     from galpy.actionAngle import actionAngleStaeckel